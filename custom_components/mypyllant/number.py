@@ -44,8 +44,7 @@ class SystemHolidayDurationNumber(HolidayEntity, NumberEntity):
     _attr_icon = "mdi:hvac-off"
 
     def __init__(self, index: int, coordinator: "SystemCoordinator") -> None:
-        super(SystemCoordinatorEntity, self).__init__(coordinator)
-        self.index = index
+        SystemCoordinatorEntity.__init__(self, index, coordinator)
 
     @property
     def native_max_value(self) -> float:
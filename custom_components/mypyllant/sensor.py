@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cached_property
+from itertools import chain
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -44,104 +47,111 @@ DATA_UNIT_MAP = {
 }
 
 
-async def create_system_sensors(
-    hass: HomeAssistant, config: ConfigEntry
-) -> list[SensorEntity]:
-    system_coordinator: SystemCoordinator = hass.data[DOMAIN][config.entry_id][
-        "system_coordinator"
-    ]
-    if not system_coordinator.data:
-        _LOGGER.warning("No system data, skipping sensors")
-        return []
-
-    sensors: list[SensorEntity] = []
-    _LOGGER.debug("Creating system sensors for %s", system_coordinator.data)
+def _iter_system_sensors(
+    system_coordinator: SystemCoordinator,
+) -> Iterator[SensorEntity]:
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
     for index, system in enumerate(system_coordinator.data):
         if system.outdoor_temperature is not None:
-            sensors.append(SystemOutdoorTemperatureSensor(index, system_coordinator))
+            yield SystemOutdoorTemperatureSensor(index, system_coordinator)
         if system.water_pressure is not None:
-            sensors.append(SystemWaterPressureSensor(index, system_coordinator))
-        sensors.append(HomeEntity(index, system_coordinator))
+            yield SystemWaterPressureSensor(index, system_coordinator)
+        yield HomeEntity(index, system_coordinator)
 
         for device_index, device in enumerate(system.devices):
-            _LOGGER.debug("Creating SystemDevice sensors for %s", device)
+            if debug:
+                _LOGGER.debug("Creating SystemDevice sensors for %s", device)
 
             if "water_pressure" in device.operational_data:
-                sensors.append(
-                    SystemDeviceWaterPressureSensor(
-                        index, device_index, system_coordinator
-                    )
+                yield SystemDeviceWaterPressureSensor(
+                    index, device_index, system_coordinator
                 )
 
         for zone_index, zone in enumerate(system.zones):
-            _LOGGER.debug("Creating Zone sensors for %s", zone)
-            sensors.append(
-                ZoneDesiredRoomTemperatureSetpointSensor(
-                    index, zone_index, system_coordinator
-                )
+            if debug:
+                _LOGGER.debug("Creating Zone sensors for %s", zone)
+            yield ZoneDesiredRoomTemperatureSetpointSensor(
+                index, zone_index, system_coordinator
             )
             if zone.current_room_temperature is not None:
-                sensors.append(
-                    ZoneCurrentRoomTemperatureSensor(
-                        index, zone_index, system_coordinator
-                    )
+                yield ZoneCurrentRoomTemperatureSensor(
+                    index, zone_index, system_coordinator
                 )
             if zone.current_room_humidity is not None:
-                sensors.append(
-                    ZoneHumiditySensor(index, zone_index, system_coordinator)
-                )
-            sensors.append(
-                ZoneHeatingOperatingModeSensor(index, zone_index, system_coordinator)
-            )
-            sensors.append(
-                ZoneHeatingStateSensor(index, zone_index, system_coordinator)
-            )
-            sensors.append(
-                ZoneCurrentSpecialFunctionSensor(index, zone_index, system_coordinator)
+                yield ZoneHumiditySensor(index, zone_index, system_coordinator)
+            yield ZoneHeatingOperatingModeSensor(index, zone_index, system_coordinator)
+            yield ZoneHeatingStateSensor(index, zone_index, system_coordinator)
+            yield ZoneCurrentSpecialFunctionSensor(
+                index, zone_index, system_coordinator
             )
 
         for circuit_index, circuit in enumerate(system.circuits):
-            _LOGGER.debug("Creating Circuit sensors for %s", circuit)
-            sensors.append(CircuitStateSensor(index, circuit_index, system_coordinator))
+            if debug:
+                _LOGGER.debug("Creating Circuit sensors for %s", circuit)
+            yield CircuitStateSensor(index, circuit_index, system_coordinator)
             if circuit.current_circuit_flow_temperature is not None:
-                sensors.append(
-                    CircuitFlowTemperatureSensor(
-                        index, circuit_index, system_coordinator
-                    )
+                yield CircuitFlowTemperatureSensor(
+                    index, circuit_index, system_coordinator
                 )
             if circuit.heating_curve is not None:
-                sensors.append(
-                    CircuitHeatingCurveSensor(index, circuit_index, system_coordinator)
+                yield CircuitHeatingCurveSensor(
+                    index, circuit_index, system_coordinator
                 )
             if circuit.min_flow_temperature_setpoint is not None:
-                sensors.append(
-                    CircuitMinFlowTemperatureSetpointSensor(
-                        index, circuit_index, system_coordinator
-                    )
+                yield CircuitMinFlowTemperatureSetpointSensor(
+                    index, circuit_index, system_coordinator
                 )
 
         for dhw_index, dhw in enumerate(system.domestic_hot_water):
-            _LOGGER.debug("Creating Domestic Hot Water sensors for %s", dhw)
+            if debug:
+                _LOGGER.debug("Creating Domestic Hot Water sensors for %s", dhw)
             if dhw.current_dhw_temperature:
-                sensors.append(
-                    DomesticHotWaterTankTemperatureSensor(
-                        index, dhw_index, system_coordinator
-                    )
-                )
-            sensors.append(
-                DomesticHotWaterSetPointSensor(index, dhw_index, system_coordinator)
-            )
-            sensors.append(
-                DomesticHotWaterOperationModeSensor(
+                yield DomesticHotWaterTankTemperatureSensor(
                     index, dhw_index, system_coordinator
                 )
+            yield DomesticHotWaterSetPointSensor(index, dhw_index, system_coordinator)
+            yield DomesticHotWaterOperationModeSensor(
+                index, dhw_index, system_coordinator
             )
-            sensors.append(
-                DomesticHotWaterCurrentSpecialFunctionSensor(
-                    index, dhw_index, system_coordinator
-                )
+            yield DomesticHotWaterCurrentSpecialFunctionSensor(
+                index, dhw_index, system_coordinator
             )
-    return sensors
+
+
+async def create_system_sensors(
+    hass: HomeAssistant, config: ConfigEntry
+) -> list[SensorEntity]:
+    system_coordinator: SystemCoordinator = hass.data[DOMAIN][config.entry_id][
+        "system_coordinator"
+    ]
+    if not system_coordinator.data:
+        _LOGGER.warning("No system data, skipping sensors")
+        return []
+
+    _LOGGER.debug("Creating system sensors for %s", system_coordinator.data)
+    return list(_iter_system_sensors(system_coordinator))
+
+
+def _iter_daily_data_sensors(
+    daily_data_coordinator: DailyDataCoordinator,
+) -> Iterator[SensorEntity]:
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    for system_id, system_devices in daily_data_coordinator.data.items():
+        if debug:
+            _LOGGER.debug("Creating efficiency sensor for System %s", system_id)
+        yield EfficiencySensor(system_id, None, daily_data_coordinator)
+        for de_index, devices_data in enumerate(system_devices["devices_data"]):
+            if not devices_data:
+                continue
+            if debug:
+                _LOGGER.debug(
+                    "Creating efficiency sensor for System %s and Device %i",
+                    system_id,
+                    de_index,
+                )
+            yield EfficiencySensor(system_id, de_index, daily_data_coordinator)
+            for da_index in range(len(devices_data)):
+                yield DataSensor(system_id, de_index, da_index, daily_data_coordinator)
 
 
 async def create_daily_data_sensors(
@@ -157,53 +167,55 @@ async def create_daily_data_sensors(
         _LOGGER.warning("No daily data, skipping sensors")
         return []
 
-    sensors: list[SensorEntity] = []
-    for system_id, system_devices in daily_data_coordinator.data.items():
-        _LOGGER.debug("Creating efficiency sensor for System %s", system_id)
-        sensors.append(EfficiencySensor(system_id, None, daily_data_coordinator))
-        for de_index, devices_data in enumerate(system_devices["devices_data"]):
-            if len(devices_data) == 0:
-                continue
-            _LOGGER.debug(
-                "Creating efficiency sensor for System %s and Device %i",
-                system_id,
-                de_index,
-            )
-            sensors.append(
-                EfficiencySensor(system_id, de_index, daily_data_coordinator)
-            )
-            for da_index, _ in enumerate(
-                daily_data_coordinator.data[system_id]["devices_data"][de_index]
-            ):
-                sensors.append(
-                    DataSensor(system_id, de_index, da_index, daily_data_coordinator)
-                )
-
-    return sensors
+    return list(_iter_daily_data_sensors(daily_data_coordinator))
 
 
 async def async_setup_entry(
     hass: HomeAssistant, config: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    async_add_entities(await create_system_sensors(hass, config))
-    async_add_entities(await create_daily_data_sensors(hass, config))
+    system_sensors, daily_data_sensors = await asyncio.gather(
+        create_system_sensors(hass, config), create_daily_data_sensors(hass, config)
+    )
+    async_add_entities(system_sensors + daily_data_sensors)
+
+
+class SkipUnchangedStateSensor(CoordinatorEntity, SensorEntity):
+    """
+    Only writes the state on coordinator updates if the availability, value or attributes changed
+
+    Needs to come before the entity base class, which provides _async_update_attrs
+    """
+
+    _async_update_attrs: Callable[[], None]
+    _last_written_state: tuple[bool, Any, Mapping[str, Any] | None] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        state = (self.available, self.native_value, self.extra_state_attributes)
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        self.async_write_ha_state()
 
 
 class SystemSensor(SystemCoordinatorEntity, SensorEntity):
     pass
 
 
-class SystemOutdoorTemperatureSensor(SystemSensor):
+class SystemOutdoorTemperatureSensor(SkipUnchangedStateSensor, SystemSensor):
     _attr_native_unit_of_measurement = TEMP_CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        if self.system.outdoor_temperature is not None:
-            return round(self.system.outdoor_temperature, 1)
-        else:
-            return None
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        self._attr_native_value = (
+            None
+            if self.system.outdoor_temperature is None
+            else round(self.system.outdoor_temperature, 1)
+        )
 
     @property
     def unique_id(self) -> str:
@@ -214,17 +226,19 @@ class SystemOutdoorTemperatureSensor(SystemSensor):
         return f"{self.name_prefix} Outdoor Temperature"
 
 
-class SystemWaterPressureSensor(SystemSensor):
+class SystemWaterPressureSensor(SkipUnchangedStateSensor, SystemSensor):
     _attr_native_unit_of_measurement = PRESSURE_BAR
     _attr_device_class = SensorDeviceClass.PRESSURE
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        if self.system.water_pressure is not None:
-            return round(self.system.water_pressure, 1)
-        else:
-            return None
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        self._attr_native_value = (
+            None
+            if self.system.water_pressure is None
+            else round(self.system.water_pressure, 1)
+        )
 
     @property
     def unique_id(self) -> str:
@@ -239,7 +253,9 @@ class SystemWaterPressureSensor(SystemSensor):
         return f"{self.name_prefix} System Water Pressure"
 
 
-class HomeEntity(CoordinatorEntity, SensorEntity):
+class HomeEntity(SkipUnchangedStateSensor):
+    system: System
+
     def __init__(
         self,
         system_index: int,
@@ -247,37 +263,34 @@ class HomeEntity(CoordinatorEntity, SensorEntity):
     ):
         super().__init__(coordinator)
         self.system_index = system_index
+        self._async_update_attrs()
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.id_infix)},
+            name=self.name_prefix,
+            manufacturer=self.system.brand_name,
+            model=self.system.home.nomenclature,
+            sw_version=self.system.home.firmware_version,
+        )
 
-    @property
-    def system(self) -> System:
-        return self.coordinator.data[self.system_index]
+    @callback
+    def _async_update_attrs(self) -> None:
+        self.system = self.coordinator.data[self.system_index]
+        self._attr_extra_state_attributes = (
+            self.system.home.extra_fields | self.system.extra_fields
+        )
 
     @property
     def entity_category(self) -> EntityCategory | None:
         return EntityCategory.DIAGNOSTIC
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        return self.system.home.extra_fields | self.system.extra_fields
-
-    @property
+    @cached_property
     def name_prefix(self) -> str:
         return f"{self.system.home.home_name or self.system.home.nomenclature}"
 
-    @property
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system.id}_home"
 
-    @property
-    def device_info(self):
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.id_infix)},
-            name=self.name_prefix,
-            manufacturer=self.system.brand_name,
-            model=self.system.home.nomenclature,
-            sw_version=self.system.home.firmware_version,
-        )
-
     @property
     def unique_id(self) -> str:
         return f"{DOMAIN}_{self.id_infix}_base"
@@ -288,7 +301,7 @@ class HomeEntity(CoordinatorEntity, SensorEntity):
 
     @property
     def name(self):
-        return f"{self.system.home.home_name or self.system.home.nomenclature} Firmware Version"
+        return f"{self.name_prefix} Firmware Version"
 
 
 class ZoneDesiredRoomTemperatureSetpointSensor(ZoneCoordinatorEntity, SensorEntity):
@@ -314,7 +327,7 @@ class ZoneDesiredRoomTemperatureSetpointSensor(ZoneCoordinatorEntity, SensorEnti
         return f"{DOMAIN}_{self.id_infix}_desired_temperature"
 
 
-class ZoneCurrentRoomTemperatureSensor(ZoneCoordinatorEntity, SensorEntity):
+class ZoneCurrentRoomTemperatureSensor(SkipUnchangedStateSensor, ZoneCoordinatorEntity):
     _attr_native_unit_of_measurement = TEMP_CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -323,9 +336,10 @@ class ZoneCurrentRoomTemperatureSensor(ZoneCoordinatorEntity, SensorEntity):
     def name(self):
         return f"{self.name_prefix} Current Temperature"
 
-    @property
-    def native_value(self):
-        return (
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        self._attr_native_value = (
             None
             if self.zone.current_room_temperature is None
             else round(self.zone.current_room_temperature, 1)
@@ -354,7 +368,7 @@ class ZoneHumiditySensor(ZoneCoordinatorEntity, SensorEntity):
         return f"{DOMAIN}_{self.id_infix}_humidity"
 
 
-class ZoneHeatingOperatingModeSensor(ZoneCoordinatorEntity, SensorEntity):
+class ZoneHeatingOperatingModeSensor(SkipUnchangedStateSensor, ZoneCoordinatorEntity):
     @property
     def name(self):
         return f"{self.name_prefix} Heating Operating Mode"
@@ -372,7 +386,7 @@ class ZoneHeatingOperatingModeSensor(ZoneCoordinatorEntity, SensorEntity):
         return EntityCategory.DIAGNOSTIC
 
 
-class ZoneHeatingStateSensor(ZoneCoordinatorEntity, SensorEntity):
+class ZoneHeatingStateSensor(SkipUnchangedStateSensor, ZoneCoordinatorEntity):
     @property
     def name(self):
         return f"{self.name_prefix} Heating State"
@@ -390,7 +404,7 @@ class ZoneHeatingStateSensor(ZoneCoordinatorEntity, SensorEntity):
         return EntityCategory.DIAGNOSTIC
 
 
-class ZoneCurrentSpecialFunctionSensor(ZoneCoordinatorEntity, SensorEntity):
+class ZoneCurrentSpecialFunctionSensor(SkipUnchangedStateSensor, ZoneCoordinatorEntity):
     @property
     def name(self):
         return f"{self.name_prefix} Current Special Function"
@@ -410,6 +424,8 @@ class ZoneCurrentSpecialFunctionSensor(ZoneCoordinatorEntity, SensorEntity):
 
 class CircuitSensor(CoordinatorEntity, SensorEntity):
     coordinator: SystemCoordinator
+    system: System
+    circuit: Circuit
 
     def __init__(
         self, system_index: int, circuit_index: int, coordinator: SystemCoordinator
@@ -417,27 +433,27 @@ class CircuitSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.system_index = system_index
         self.circuit_index = circuit_index
+        self._async_update_attrs()
+        self._attr_device_info = {"identifiers": {(DOMAIN, self.id_infix)}}
 
-    @property
-    def system(self) -> System:
-        return self.coordinator.data[self.system_index]
+    @callback
+    def _async_update_attrs(self) -> None:
+        self.system = self.coordinator.data[self.system_index]
+        self.circuit = self.system.circuits[self.circuit_index]
 
-    @property
-    def circuit(self) -> Circuit:
-        return self.system.circuits[self.circuit_index]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
 
-    @property
+    @cached_property
     def name_prefix(self) -> str:
         return f"{self.system.home.home_name or self.system.home.nomenclature} Circuit {self.circuit_index}"
 
-    @property
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system.id}_circuit_{self.circuit.index}"
 
-    @property
-    def device_info(self):
-        return {"identifiers": {(DOMAIN, self.id_infix)}}
-
 
 class CircuitFlowTemperatureSensor(CircuitSensor):
     _attr_native_unit_of_measurement = TEMP_CELSIUS
@@ -461,7 +477,7 @@ class CircuitFlowTemperatureSensor(CircuitSensor):
         return f"{DOMAIN}_{self.id_infix}_flow_temperature"
 
 
-class CircuitStateSensor(CircuitSensor):
+class CircuitStateSensor(SkipUnchangedStateSensor, CircuitSensor):
     @property
     def name(self):
         return f"{self.name_prefix} State"
@@ -505,19 +521,21 @@ class CircuitMinFlowTemperatureSetpointSensor(CircuitSensor):
         return f"{DOMAIN}_{self.id_infix}_min_flow_temperature_setpoint"
 
 
-class CircuitHeatingCurveSensor(CircuitSensor):
+class CircuitHeatingCurveSensor(SkipUnchangedStateSensor, CircuitSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def name(self):
         return f"{self.name_prefix} Heating Curve"
 
-    @property
-    def native_value(self):
-        if self.circuit.heating_curve is not None:
-            return round(self.circuit.heating_curve, 2)
-        else:
-            return None
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        self._attr_native_value = (
+            None
+            if self.circuit.heating_curve is None
+            else round(self.circuit.heating_curve, 2)
+        )
 
     @property
     def entity_category(self) -> EntityCategory | None:
@@ -567,7 +585,7 @@ class DomesticHotWaterSetPointSensor(DomesticHotWaterCoordinatorEntity, SensorEn
 
 
 class DomesticHotWaterOperationModeSensor(
-    DomesticHotWaterCoordinatorEntity, SensorEntity
+    SkipUnchangedStateSensor, DomesticHotWaterCoordinatorEntity
 ):
     @property
     def name(self):
@@ -587,7 +605,7 @@ class DomesticHotWaterOperationModeSensor(
 
 
 class DomesticHotWaterCurrentSpecialFunctionSensor(
-    DomesticHotWaterCoordinatorEntity, SensorEntity
+    SkipUnchangedStateSensor, DomesticHotWaterCoordinatorEntity
 ):
     @property
     def name(self):
@@ -606,8 +624,12 @@ class DomesticHotWaterCurrentSpecialFunctionSensor(
         return f"{DOMAIN}_{self.id_infix}_current_special_function"
 
 
-class DataSensor(CoordinatorEntity, SensorEntity):
+class DataSensor(SkipUnchangedStateSensor):
     coordinator: DailyDataCoordinator
+    _device_data: DeviceData | None
+    _device: Device | None
+    _data_bucket: DeviceDataBucket | None
+    _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     def __init__(
@@ -621,20 +643,26 @@ class DataSensor(CoordinatorEntity, SensorEntity):
         self.system_id = system_id
         self.da_index = da_index
         self.de_index = de_index
-        if (
-            self.device_data is not None
-            and self.device_data.energy_type in DATA_UNIT_MAP
-        ):
-            self._attr_native_unit_of_measurement = DATA_UNIT_MAP[
-                self.device_data.energy_type
-            ]
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        _LOGGER.debug(
-            "Finishing init of %s = %s and unique id %s",
-            self.name,
-            self.native_value,
-            self.unique_id,
-        )
+        self._async_update_attrs()
+        if self.device is not None:
+            self._attr_device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.id_infix)},
+                name=self.name_prefix,
+                manufacturer=self.device.brand_name,
+                model=self.device.product_name_display,
+            )
+        device_data = self.device_data
+        if device_data is not None and device_data.energy_type is not None:
+            unit = DATA_UNIT_MAP.get(device_data.energy_type)
+            if unit:
+                self._attr_native_unit_of_measurement = unit
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Finishing init of %s = %s and unique id %s",
+                self.name,
+                self.native_value,
+                self.unique_id,
+            )
 
     @property
     def name(self):
@@ -648,18 +676,29 @@ class DataSensor(CoordinatorEntity, SensorEntity):
         )
         return f"{self.name_prefix} {et}{om}"
 
+    @callback
+    def _async_update_attrs(self) -> None:
+        devices_data = self.coordinator.data[self.system_id]["devices_data"]
+        if self.de_index < len(devices_data) and self.da_index < len(
+            devices_data[self.de_index]
+        ):
+            self._device_data = devices_data[self.de_index][self.da_index]
+        else:
+            self._device_data = None
+        if self._device_data is None:
+            self._device = None
+            self._data_bucket = None
+        else:
+            self._device = self._device_data.device
+            # The last bucket with a value, without building a filtered copy of the list
+            self._data_bucket = next(
+                (d for d in reversed(self._device_data.data) if d.value is not None),
+                None,
+            )
+
     @property
     def device_data(self) -> DeviceData | None:
-        if len(self.coordinator.data[self.system_id]["devices_data"]) <= self.de_index:
-            return None
-        if (
-            len(self.coordinator.data[self.system_id]["devices_data"][self.de_index])
-            <= self.da_index
-        ):
-            return None
-        return self.coordinator.data[self.system_id]["devices_data"][self.de_index][
-            self.da_index
-        ]
+        return self._device_data
 
     @property
     def home_name(self) -> str:
@@ -667,19 +706,11 @@ class DataSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def device(self) -> Device | None:
-        if self.device_data is None:
-            return None
-        return self.device_data.device
+        return self._device
 
     @property
     def data_bucket(self) -> DeviceDataBucket | None:
-        if self.device_data is None:
-            return None
-        data = [d for d in self.device_data.data if d.value is not None]
-        if len(data) > 0:
-            return data[-1]
-        else:
-            return None
+        return self._data_bucket
 
     @property
     def unique_id(self) -> str | None:
@@ -687,43 +718,33 @@ class DataSensor(CoordinatorEntity, SensorEntity):
             return None
         return f"{DOMAIN}_{self.system_id}_{self.device.device_uuid}_{self.da_index}"
 
-    @property
+    @cached_property
     def name_prefix(self) -> str:
         name_display = f" {self.device.name_display}" if self.device is not None else ""
         return f"{self.home_name} Device {self.de_index}{name_display}"
 
-    @property
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system_id}_device_{self.device.device_uuid if self.device is not None else ''}"
 
-    @property
-    def device_info(self):
-        if self.device is None:
-            return None
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.id_infix)},
-            name=self.name_prefix,
-            manufacturer=self.device.brand_name,
-            model=self.device.product_name_display,
-        )
-
     @property
     def native_value(self):
-        return self.data_bucket.value if self.data_bucket else None
+        return self._data_bucket.value if self._data_bucket else None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         super()._handle_coordinator_update()
-        _LOGGER.debug(
-            "Updated DataSensor %s = %s last reset on %s, from data %s",
-            self.unique_id,
-            self.native_value,
-            self.last_reset,
-            self.device_data.data if self.device_data is not None else None,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Refreshed DataSensor %s = %s last reset on %s, from data %s",
+                self.unique_id,
+                self.native_value,
+                self.last_reset,
+                self.device_data.data if self.device_data is not None else None,
+            )
 
 
-class EfficiencySensor(CoordinatorEntity, SensorEntity):
+class EfficiencySensor(SkipUnchangedStateSensor):
     coordinator: DailyDataCoordinator
     _attr_state_class = SensorStateClass.MEASUREMENT
 
@@ -733,84 +754,84 @@ class EfficiencySensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.system_id = system_id
         self.de_index = de_index
+        self._async_update_attrs()
+        self._first_device_data = next(iter(self._iter_device_data()), None)
+        if self._first_device_data is None:
+            self._attr_device_info = None
+        elif self.de_index is not None and self._first_device_data.device is not None:
+            self._attr_device_info = {
+                "identifiers": {
+                    (
+                        DOMAIN,
+                        f"{self.system_id}_device_{self._first_device_data.device.device_uuid}",
+                    )
+                }
+            }
+        elif self.de_index is None:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, f"{self.system_id}_home")}
+            }
 
-    @property
-    def device_data_list(self) -> list[DeviceData]:
+    def _iter_device_data(self) -> Iterable[DeviceData]:
+        """
+        Returns the device data of the device, or of all devices in the system without copying them
+        into a flat list
+        """
+        devices_data = self.coordinator.data[self.system_id]["devices_data"]
         if self.de_index is None:
-            return [
-                item
-                for row in self.coordinator.data[self.system_id]["devices_data"]
-                for item in row
-            ]
+            return chain.from_iterable(devices_data)
         else:
-            return self.coordinator.data[self.system_id]["devices_data"][self.de_index]
+            return devices_data[self.de_index]
 
     @property
     def home_name(self) -> str:
         return self.coordinator.data[self.system_id]["home_name"]
 
+    @callback
+    def _async_update_attrs(self) -> None:
+        """
+        Sums up consumed and generated energy in a single pass over the device data
+        """
+        energy_consumed = 0.0
+        heat_energy_generated = 0.0
+        for v in self._iter_device_data():
+            if not v.data or not (value := v.data[-1].value):
+                continue
+            if v.energy_type == "CONSUMED_ELECTRICAL_ENERGY":
+                energy_consumed += value
+            elif v.energy_type == "HEAT_GENERATED":
+                heat_energy_generated += value
+        self._energy_consumed = energy_consumed
+        self._heat_energy_generated = heat_energy_generated
+
     @property
     def energy_consumed(self) -> float:
         """
         Returns total consumed electrical energy for the current day
         """
-        return sum(
-            [
-                v.data[-1].value
-                for v in self.device_data_list
-                if len(v.data)
-                and v.data[-1].value
-                and v.energy_type == "CONSUMED_ELECTRICAL_ENERGY"
-            ]
-        )
+        return self._energy_consumed
 
     @property
     def heat_energy_generated(self) -> float:
         """
         Returns total generated heating energy for the current day
         """
-        return sum(
-            [
-                v.data[-1].value
-                for v in self.device_data_list
-                if len(v.data)
-                and v.data[-1].value
-                and v.energy_type == "HEAT_GENERATED"
-            ]
-        )
+        return self._heat_energy_generated
 
     @property
     def unique_id(self) -> str:
         if (
-            len(self.device_data_list) > 0
+            self._first_device_data is not None
             and self.de_index is not None
-            and self.device_data_list[0].device is not None
+            and self._first_device_data.device is not None
         ):
-            return f"{DOMAIN}_{self.system_id}_device_{self.device_data_list[0].device.device_uuid}_heating_energy_efficiency"
+            return f"{DOMAIN}_{self.system_id}_device_{self._first_device_data.device.device_uuid}_heating_energy_efficiency"
         else:
             return f"{DOMAIN}_{self.system_id}_heating_energy_efficiency"
 
-    @property
-    def device_info(self):
-        if len(self.device_data_list) == 0:
-            return None
-        if self.de_index is not None and self.device_data_list[0].device is not None:
-            return {
-                "identifiers": {
-                    (
-                        DOMAIN,
-                        f"{self.system_id}_device_{self.device_data_list[0].device.device_uuid}",
-                    )
-                }
-            }
-        elif self.de_index is None:
-            return {"identifiers": {(DOMAIN, f"{self.system_id}_home")}}
-        else:
-            return None
-
     @property
     def native_value(self) -> float | None:
-        if self.energy_consumed is not None and self.energy_consumed > 0:
+        if self.energy_consumed > 0:
             return round(self.heat_energy_generated / self.energy_consumed, 1)
         else:
             return None
@@ -818,17 +839,19 @@ class EfficiencySensor(CoordinatorEntity, SensorEntity):
     @property
     def name(self):
         if (
-            len(self.device_data_list) > 0
+            self._first_device_data is not None
             and self.de_index is not None
-            and self.device_data_list[0].device is not None
+            and self._first_device_data.device is not None
         ):
-            return f"{self.home_name} Device {self.de_index} {self.device_data_list[0].device.name_display} Heating Energy Efficiency"
+            return f"{self.home_name} Device {self.de_index} {self._first_device_data.device.name_display} Heating Energy Efficiency"
         else:
             return f"{self.home_name} Heating Energy Efficiency"
 
 
 class SystemDeviceSensor(CoordinatorEntity, SensorEntity):
     coordinator: SystemCoordinator
+    system: System
+    device: Device
 
     def __init__(
         self, system_index: int, device_index: int, coordinator: SystemCoordinator
@@ -836,28 +859,28 @@ class SystemDeviceSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.system_index = system_index
         self.device_index = device_index
+        self._async_update_attrs()
+        self._attr_device_info = {"identifiers": {(DOMAIN, self.id_infix)}}
 
-    @property
+    @callback
+    def _async_update_attrs(self) -> None:
+        self.system = self.coordinator.data[self.system_index]
+        self.device = self.system.devices[self.device_index]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @cached_property
     def name_prefix(self) -> str:
         name_display = f" {self.device.name_display}" if self.device is not None else ""
         return f"{self.system.home.home_name or self.system.home.nomenclature} Device {self.device_index}{name_display}"
 
-    @property
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system.id}_device_{self.device.device_uuid if self.device is not None else ''}"
 
-    @property
-    def system(self) -> System:
-        return self.coordinator.data[self.system_index]
-
-    @property
-    def device(self) -> Device:
-        return self.system.devices[self.device_index]
-
-    @property
-    def device_info(self):
-        return {"identifiers": {(DOMAIN, self.id_infix)}}
-
 
 class SystemDeviceWaterPressureSensor(SystemDeviceSensor):
     _attr_native_unit_of_measurement = PRESSURE_BAR
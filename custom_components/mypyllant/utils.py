@@ -4,9 +4,11 @@ import logging
 import typing
 from asyncio.exceptions import CancelledError
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from aiohttp.client_exceptions import ClientResponseError
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from custom_components.mypyllant.const import DOMAIN, OPTION_DEFAULT_HOLIDAY_DURATION
@@ -21,27 +23,31 @@ logger = logging.getLogger(__name__)
 
 class SystemCoordinatorEntity(CoordinatorEntity):
     coordinator: "SystemCoordinator"
+    system: "System"
 
     def __init__(self, index: int, coordinator: "SystemCoordinator") -> None:
         super().__init__(coordinator)
         self.index = index
+        self._async_update_attrs()
+        self._attr_device_info = {"identifiers": {(DOMAIN, self.id_infix)}}
 
-    @property
-    def system(self) -> "System":
-        return self.coordinator.data[self.index]
+    @callback
+    def _async_update_attrs(self) -> None:
+        self.system = self.coordinator.data[self.index]
 
-    @property
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system.id}_home"
 
-    @property
+    @cached_property
     def name_prefix(self) -> str:
         return f"{self.system.home.home_name or self.system.home.nomenclature}"
 
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        return {"identifiers": {(DOMAIN, self.id_infix)}}
-
 
 class HolidayEntity(SystemCoordinatorEntity):
     def __init__(
@@ -123,6 +129,8 @@ def is_api_down_exception(exc_info: Exception) -> bool:
 
 class DomesticHotWaterCoordinatorEntity(CoordinatorEntity):
     coordinator: SystemCoordinator
+    system: System
+    domestic_hot_water: DomesticHotWater
 
     def __init__(
         self, system_index: int, dhw_index: int, coordinator: SystemCoordinator
@@ -130,37 +138,32 @@ class DomesticHotWaterCoordinatorEntity(CoordinatorEntity):
         super().__init__(coordinator)
         self.system_index = system_index
         self.dhw_index = dhw_index
+        self._async_update_attrs()
+        self._attr_device_info = {"identifiers": {(DOMAIN, self.id_infix)}}
 
-    @property
-    def system(self) -> System:
-        return self.coordinator.data[self.system_index]
+    @callback
+    def _async_update_attrs(self) -> None:
+        self.system = self.coordinator.data[self.system_index]
+        self.domestic_hot_water = self.system.domestic_hot_water[self.dhw_index]
 
-    @property
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @cached_property
     def name_prefix(self) -> str:
         return f"{self.system.home.home_name or self.system.home.nomenclature} Domestic Hot Water {self.dhw_index}"
 
-    @property
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system.id}_domestic_hot_water_{self.dhw_index}"
 
-    @property
-    def domestic_hot_water(self) -> DomesticHotWater:
-        return self.system.domestic_hot_water[self.dhw_index]
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {
-                (
-                    DOMAIN,
-                    self.id_infix,
-                )
-            }
-        }
-
 
 class ZoneCoordinatorEntity(CoordinatorEntity):
     coordinator: SystemCoordinator
+    system: System
+    zone: Zone
 
     def __init__(
         self, system_index: int, zone_index: int, coordinator: SystemCoordinator
@@ -168,14 +171,22 @@ class ZoneCoordinatorEntity(CoordinatorEntity):
         super().__init__(coordinator)
         self.system_index = system_index
         self.zone_index = zone_index
+        self._async_update_attrs()
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.id_infix)},
+            name=self.name_prefix,
+            manufacturer=self.system.brand_name,
+        )
 
-    @property
-    def system(self) -> System:
-        return self.coordinator.data[self.system_index]
+    @callback
+    def _async_update_attrs(self) -> None:
+        self.system = self.coordinator.data[self.system_index]
+        self.zone = self.system.zones[self.zone_index]
 
-    @property
-    def zone(self) -> Zone:
-        return self.system.zones[self.zone_index]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def circuit_name_suffix(self) -> str:
@@ -184,22 +195,14 @@ class ZoneCoordinatorEntity(CoordinatorEntity):
         else:
             return f" (Circuit {self.zone.associated_circuit_index})"
 
-    @property
+    @cached_property
     def name_prefix(self) -> str:
         return f"{self.system.home.home_name or self.system.home.nomenclature} Zone {shorten_zone_name(self.zone.name)}{self.circuit_name_suffix}"
 
-    @property
+    @cached_property
     def id_infix(self) -> str:
         return f"{self.system.id}_zone_{self.zone.index}"
 
-    @property
-    def device_info(self):
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.id_infix)},
-            name=self.name_prefix,
-            manufacturer=self.system.brand_name,
-        )
-
     @property
     def available(self) -> bool | None:
         return self.zone.is_active
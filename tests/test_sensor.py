@@ -1,9 +1,22 @@
+import copy
+from datetime import timedelta
+from unittest import mock
+
 import pytest as pytest
+from homeassistant.helpers import entity_registry as er
 from myPyllant.api import MyPyllantAPI
 from myPyllant.models import CircuitState, DeviceData
 from myPyllant.tests.utils import list_test_data
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    MockPlatform,
+)
+
+from custom_components.mypyllant import DailyDataCoordinator, SystemCoordinator
+from custom_components.mypyllant.const import DOMAIN
 
 from custom_components.mypyllant.sensor import (
+    async_setup_entry,
     CircuitFlowTemperatureSensor,
     CircuitHeatingCurveSensor,
     CircuitMinFlowTemperatureSetpointSensor,
@@ -13,7 +26,9 @@ from custom_components.mypyllant.sensor import (
     DomesticHotWaterOperationModeSensor,
     DomesticHotWaterSetPointSensor,
     DomesticHotWaterTankTemperatureSensor,
+    EfficiencySensor,
     HomeEntity,
+    SystemDeviceWaterPressureSensor,
     SystemOutdoorTemperatureSensor,
     SystemWaterPressureSensor,
     ZoneCurrentRoomTemperatureSensor,
@@ -22,6 +37,8 @@ from custom_components.mypyllant.sensor import (
     ZoneHeatingOperatingModeSensor,
     ZoneHumiditySensor,
 )
+from tests.conftest import TEST_OPTIONS, MockConfigEntry
+from tests.test_init import test_user_input
 
 
 @pytest.mark.parametrize("test_data", list_test_data())
@@ -93,6 +110,48 @@ async def test_zone_sensors(
         await mocked_api.aiohttp_session.close()
 
 
+@pytest.mark.parametrize("test_data", list_test_data())
+async def test_rounded_sensors(
+    mypyllant_aioresponses, mocked_api: MyPyllantAPI, system_coordinator_mock, test_data
+):
+    with mypyllant_aioresponses(test_data) as _:
+        system_coordinator_mock.data = (
+            await system_coordinator_mock._async_update_data()
+        )
+        system = system_coordinator_mock.data[0]
+        system_state = system.state.setdefault("system", {})
+        system_state["outdoor_temperature"] = 12.345
+        system_state["system_water_pressure"] = 1.678
+        system.zones[0].current_room_temperature = 21.449
+        system.circuits[0].heating_curve = 1.2345
+        cases = [
+            (SystemOutdoorTemperatureSensor(0, system_coordinator_mock), 12.3),
+            (SystemWaterPressureSensor(0, system_coordinator_mock), 1.7),
+            (ZoneCurrentRoomTemperatureSensor(0, 0, system_coordinator_mock), 21.4),
+            (CircuitHeatingCurveSensor(0, 0, system_coordinator_mock), 1.23),
+        ]
+        for sensor, expected in cases:
+            assert sensor.native_value == expected
+
+        for sensor, _ in cases:
+            with mock.patch.object(sensor, "async_write_ha_state") as write_state:
+                sensor._handle_coordinator_update()
+                write_state.reset_mock()
+                sensor._handle_coordinator_update()
+                write_state.assert_not_called()
+
+        system_state["outdoor_temperature"] = 13.05
+        system_state["system_water_pressure"] = 1.5
+        system.zones[0].current_room_temperature = 19.96
+        system.circuits[0].heating_curve = 0.999
+        for (sensor, _), expected in zip(cases, [13.1, 1.5, 20.0, 1.0]):
+            with mock.patch.object(sensor, "async_write_ha_state") as write_state:
+                sensor._handle_coordinator_update()
+                write_state.assert_called_once()
+            assert sensor.native_value == expected
+        await mocked_api.aiohttp_session.close()
+
+
 @pytest.mark.parametrize("test_data", list_test_data())
 async def test_circuit_sensors(
     mypyllant_aioresponses, mocked_api: MyPyllantAPI, system_coordinator_mock, test_data
@@ -170,6 +229,49 @@ async def test_domestic_hot_water_sensor(
         await mocked_api.aiohttp_session.close()
 
 
+@pytest.mark.parametrize("test_data", list_test_data())
+async def test_sensors_refresh_cached_data(
+    mypyllant_aioresponses, mocked_api: MyPyllantAPI, system_coordinator_mock, test_data
+):
+    with mypyllant_aioresponses(test_data) as _:
+        system_coordinator_mock.data = (
+            await system_coordinator_mock._async_update_data()
+        )
+        system = system_coordinator_mock.data[0]
+        sensors = [
+            SystemWaterPressureSensor(0, system_coordinator_mock),
+            ZoneDesiredRoomTemperatureSetpointSensor(0, 0, system_coordinator_mock),
+            CircuitFlowTemperatureSensor(0, 0, system_coordinator_mock),
+        ]
+        if system.domestic_hot_water:
+            sensors.append(
+                DomesticHotWaterSetPointSensor(0, 0, system_coordinator_mock)
+            )
+        if system.devices:
+            sensors.append(
+                SystemDeviceWaterPressureSensor(0, 0, system_coordinator_mock)
+            )
+
+        system_coordinator_mock.data = copy.deepcopy(system_coordinator_mock.data)
+        new_system = system_coordinator_mock.data[0]
+        assert new_system is not system
+        for sensor in sensors:
+            with mock.patch.object(sensor, "async_write_ha_state") as write_state:
+                sensor._handle_coordinator_update()
+                write_state.assert_called_once()
+            assert sensor.system is new_system
+
+        zone_sensor, circuit_sensor = sensors[1], sensors[2]
+        assert zone_sensor.zone is new_system.zones[0]
+        assert circuit_sensor.circuit is new_system.circuits[0]
+        for sensor in sensors[3:]:
+            if isinstance(sensor, DomesticHotWaterSetPointSensor):
+                assert sensor.domestic_hot_water is new_system.domestic_hot_water[0]
+            else:
+                assert sensor.device is new_system.devices[0]
+        await mocked_api.aiohttp_session.close()
+
+
 @pytest.mark.parametrize("test_data", list_test_data())
 async def test_data_sensor(
     mypyllant_aioresponses,
@@ -194,9 +296,113 @@ async def test_data_sensor(
             data_sensor.native_value,
             (int, float, complex),
         )
+        assert (
+            data_sensor.data_bucket
+            == [d for d in data_sensor.device_data.data if d.value is not None][-1]
+        )
         assert isinstance(
             data_sensor.name,
             str,
         )
         assert data_sensor.last_reset is None
+        with mock.patch.object(data_sensor, "async_write_ha_state") as write_state:
+            data_sensor._handle_coordinator_update()
+            data_sensor._handle_coordinator_update()
+            write_state.assert_called_once()
+        await mocked_api.aiohttp_session.close()
+
+
+@pytest.mark.parametrize("test_data", list_test_data())
+async def test_efficiency_sensor(
+    mypyllant_aioresponses,
+    mocked_api: MyPyllantAPI,
+    daily_data_coordinator_mock,
+    test_data,
+):
+    with mypyllant_aioresponses(test_data) as _:
+        daily_data_coordinator_mock.data = (
+            await daily_data_coordinator_mock._async_update_data()
+        )
+        system_id = next(iter(daily_data_coordinator_mock.data), None)
+        if (
+            system_id is None
+            or not daily_data_coordinator_mock.data[system_id]["devices_data"]
+        ):
+            await mocked_api.aiohttp_session.close()
+            pytest.skip(
+                f"No devices in system {system_id}, skipping efficiency sensor tests"
+            )
+        efficiency_sensor = EfficiencySensor(
+            system_id, None, daily_data_coordinator_mock
+        )
+        devices_data = [
+            v
+            for row in daily_data_coordinator_mock.data[system_id]["devices_data"]
+            for v in row
+            if v.data and v.data[-1].value
+        ]
+        assert efficiency_sensor.energy_consumed == sum(
+            v.data[-1].value
+            for v in devices_data
+            if v.energy_type == "CONSUMED_ELECTRICAL_ENERGY"
+        )
+        assert efficiency_sensor.heat_energy_generated == sum(
+            v.data[-1].value for v in devices_data if v.energy_type == "HEAT_GENERATED"
+        )
+        assert efficiency_sensor.native_value is None or isinstance(
+            efficiency_sensor.native_value, float
+        )
+        assert isinstance(efficiency_sensor.name, str)
+        await mocked_api.aiohttp_session.close()
+
+
+@pytest.mark.parametrize("test_data", list_test_data())
+async def test_async_setup_entry(
+    hass,
+    mypyllant_aioresponses,
+    mocked_api: MyPyllantAPI,
+    test_data,
+):
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Mock Title",
+        data=test_user_input,
+        options=TEST_OPTIONS,
+    )
+    config_entry.add_to_hass(hass)
+    system_coordinator = SystemCoordinator(
+        hass, mocked_api, config_entry, update_interval=None
+    )
+    daily_data_coordinator = DailyDataCoordinator(
+        hass, mocked_api, config_entry, timedelta(seconds=10)
+    )
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        "quota_time": None,
+        "quota_exc_info": None,
+        "system_coordinator": system_coordinator,
+        "daily_data_coordinator": daily_data_coordinator,
+    }
+    platform = MockEntityPlatform(
+        hass,
+        domain="sensor",
+        platform_name=DOMAIN,
+        platform=MockPlatform(async_setup_entry=async_setup_entry),
+    )
+
+    with mypyllant_aioresponses(test_data) as _:
+        system_coordinator.data = await system_coordinator._async_update_data()
+        daily_data_coordinator.data = await daily_data_coordinator._async_update_data()
+        assert await platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+        assert platform.entities
+        entity_registry = er.async_get(hass)
+        for entity_id, entity in platform.entities.items():
+            assert hass.states.get(entity_id) is not None
+            assert entity.unique_id is not None
+            assert (
+                entity_registry.async_get_entity_id("sensor", DOMAIN, entity.unique_id)
+                == entity_id
+            )
+        await platform.async_reset()
         await mocked_api.aiohttp_session.close()